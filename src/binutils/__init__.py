@@ -59,6 +59,64 @@ class AttrFlags:
     WRITE      = 1 << 1
     READ_WRITE = READ | WRITE
 
+# Precomputed name -> value maps for the file parsers, so resolving a
+# convention or flag name is a C-level dict lookup instead of a getattr
+_CONVENTION_MAP = dict(
+    (name, getattr(Convention, name))
+    for name in dir(Convention) if not name.startswith('_'))
+
+_ATTR_FLAGS_MAP = dict(
+    (name, getattr(AttrFlags, name))
+    for name in dir(AttrFlags) if not name.startswith('_'))
+
+# Key specifications for helpers.parse_data(). They are built once here, so
+# parsing a file does not re-create the converter tuples over and over.
+_PIPE_KEYS = (
+    (KEY_BINARY, str, None),
+    (KEY_IDENTIFIER, str, None),
+    (KEY_PARAMETERS, str, None),
+    (KEY_CONVERTER, lambda x: None if x == 0 else x, 0),
+    (KEY_SRV_CHECK, helpers.as_bool, 'True'),
+    (KEY_CONVENTION, _CONVENTION_MAP.__getitem__, 'CDECL'),
+    (KEY_DOCUMENTATION, str, '')
+)
+
+_ATTRIBUTE_KEYS = (
+    (KEY_CONVERTER, str, None),
+    (KEY_IDENTIFIER, int, None),
+    (KEY_LENGTH, int, -1),
+    (KEY_IS_ARRAY, helpers.as_bool, 'False'),
+    (KEY_ALIGNED, helpers.as_bool, 'False'),
+    (KEY_ATTR_FLAGS, _ATTR_FLAGS_MAP.__getitem__, 'READ_WRITE'),
+    (KEY_DOCUMENTATION, str, '')
+)
+
+_FUNCTION_KEYS = (
+    (KEY_BINARY, str, None),
+    (KEY_IDENTIFIER, str, None),
+    (KEY_PARAMETERS, str, None),
+    (KEY_CONVERTER, lambda x: None if x == 0 else x, 0),
+    (KEY_SRV_CHECK, helpers.as_bool, 'True'),
+    (KEY_CONVENTION, _CONVENTION_MAP.__getitem__, 'THISCALL'),
+    (KEY_DOCUMENTATION, str, '')
+)
+
+_VIRTUAL_FUNCTION_KEYS = (
+    (KEY_IDENTIFIER, int, None),
+    (KEY_PARAMETERS, str, None),
+    (KEY_CONVERTER, lambda x: None if x == 0 else x, 0),
+    (KEY_CONVENTION, _CONVENTION_MAP.__getitem__, 'THISCALL'),
+    (KEY_DOCUMENTATION, str, '')
+)
+
+# The sections of a type file and the TypeManager method that builds the
+# descriptors of their members
+_TYPE_SECTIONS = (
+    (KEY_ATTRIBUTES, _ATTRIBUTE_KEYS, 'attribute'),
+    (KEY_FUNCTIONS, _FUNCTION_KEYS, 'function'),
+    (KEY_VIRTUAL_FUNCTIONS, _VIRTUAL_FUNCTION_KEYS, 'virtual_function')
+)
+
 
 # =============================================================================
 # >> CLASSES
@@ -122,6 +180,9 @@ class TypeManager(dict):
         Initializes the manager by setting the default converter.
         '''
 
+        # One shared converter closure per name
+        self._converter_cache = {}
+
         # Default converter -- do nothing
         self.set_default_converter(lambda x: x)
 
@@ -160,10 +221,15 @@ class TypeManager(dict):
     def create_converter(self, name):
         '''
         Creates a callable converter by name. That means the type is evaluated
-        when the converter gets called.
+        when the converter gets called. The same name always yields the same
+        closure, so callers can use it as a cache key.
         '''
 
-        return lambda x: self[name](x)
+        try:
+            return self._converter_cache[name]
+        except KeyError:
+            converter = self._converter_cache[name] = lambda x: self[name](x)
+            return converter
 
     def create_pipe(self, **cls_dict):
         '''
@@ -193,18 +259,7 @@ class TypeManager(dict):
         documentation = <default: ''>
         '''
 
-        data = helpers.parse_data(
-            helpers.read_files(*files),
-            (
-                (KEY_BINARY, str, None),
-                (KEY_IDENTIFIER, str, None),
-                (KEY_PARAMETERS, str, None),
-                (KEY_CONVERTER, lambda x: None if x == 0 else x, 0),
-                (KEY_SRV_CHECK, helpers.as_bool, 'True'),
-                (KEY_CONVENTION, lambda x: getattr(Convention, x), 'CDECL'),
-                (KEY_DOCUMENTATION, str, '')
-            )
-        )
+        data = helpers.parse_data(helpers.read_files(*files), _PIPE_KEYS)
 
         cls_dict = {}
         for func_name, func_data in data:
@@ -281,54 +336,15 @@ class TypeManager(dict):
         size     = raw_data.get(KEY_SIZE)
         cls_dict = { 'size':  size and int(size)}
 
-        # Parse the attributes
-        attributes = helpers.parse_data(
-            raw_data.get(KEY_ATTRIBUTES, {}),
-            (
-                (KEY_CONVERTER, str, None),
-                (KEY_IDENTIFIER, int, None),
-                (KEY_LENGTH, int, -1),
-                (KEY_IS_ARRAY, helpers.as_bool, 'False'),
-                (KEY_ALIGNED, helpers.as_bool, 'False'),
-                (KEY_ATTR_FLAGS, lambda x: getattr(AttrFlags, x), 'READ_WRITE'),
-                (KEY_DOCUMENTATION, str, '')
-            )
-        )
-
-        for name, data in attributes:
-            cls_dict[name] = self.attribute(*data)
-
-        # Parse the functions
-        functions = helpers.parse_data(
-            raw_data.get(KEY_FUNCTIONS, {}),
-            (
-                (KEY_BINARY, str, None),
-                (KEY_IDENTIFIER, str, None),
-                (KEY_PARAMETERS, str, None),
-                (KEY_CONVERTER, lambda x: None if x == 0 else x, 0),
-                (KEY_SRV_CHECK, helpers.as_bool, 'True'),
-                (KEY_CONVENTION, lambda x: getattr(Convention, x), 'THISCALL'),
-                (KEY_DOCUMENTATION, str, '')
-            )
-        )
-
-        for name, data in functions:
-            cls_dict[name] = self.function(*data)
-
-        # Parse the virtual functions
-        virtual_functions = helpers.parse_data(
-            raw_data.get(KEY_VIRTUAL_FUNCTIONS, {}),
-            (
-                (KEY_IDENTIFIER, int, None),
-                (KEY_PARAMETERS, str, None),
-                (KEY_CONVERTER, lambda x: None if x == 0 else x, 0),
-                (KEY_CONVENTION, lambda x: getattr(Convention, x), 'THISCALL'),
-                (KEY_DOCUMENTATION, str, '')
-            )
-        )
+        # Parse all sections in a single walk. Member descriptors are built
+        # lazily on first access -- only a placeholder holding the raw data
+        # is stored here, so creating a type stays cheap even if most of its
+        # members are never used.
+        for section_key, keys, kind in _TYPE_SECTIONS:
+            for name, data in helpers.parse_data(
+                    raw_data.get(section_key, {}), keys):
 
-        for name, data in virtual_functions:
-            cls_dict[name] = self.virtual_function(*data)
+                cls_dict[name] = helpers._LazyMember(self, kind, data, name)
 
         # Create the type and return it
         return self.create_type(type_name, cls_dict)
@@ -375,10 +391,37 @@ class TypeManager(dict):
             raise ValueError('You cannot align an attribute of type "%s".'% \
                 str_type)
 
-        # Getter method
-        def fget(ptr_self):
-            # Handle arrays
-            if is_array:
+        # Build the accessor names once instead of on every access
+        getter_name = 'get_' + str_type
+        setter_name = 'set_' + str_type
+        array_maker_name = 'make_%s_array'% str_type
+
+        # Resolve the accessors on Pointer once, so the closures call the
+        # unbound methods directly instead of looking them up per access. The
+        # getattr() fallbacks cover pointer types that bring their own
+        # accessor implementations.
+        getter = getattr(Pointer, getter_name, None)
+        if getter is None:
+            getter = lambda ptr_self, offset: \
+                getattr(ptr_self, getter_name)(offset)
+
+        setter = getattr(Pointer, setter_name, None)
+        if setter is None:
+            setter = lambda ptr_self, value, offset: \
+                getattr(ptr_self, setter_name)(value, offset)
+
+        array_maker = getattr(Pointer, array_maker_name, None)
+        if array_maker is None:
+            array_maker = lambda ptr_self, length: \
+                getattr(ptr_self, array_maker_name)(length)
+
+        # The configuration is fixed per attribute, so the proper getter and
+        # setter variant can be chosen here instead of re-checking it on
+        # every access.
+
+        # Getter method for arrays
+        if is_array:
+            def fget(ptr_self):
                 # This is a check for NULL pointers and required for unaligned
                 # arrays
                 ptr_self2 = ptr_self.get_ptr(offset)
@@ -394,23 +437,27 @@ class TypeManager(dict):
                         self.create_converter(converter_name)
                     )
 
-                return getattr(ptr_self, 'make_%s_array'% str_type)(length)
+                return array_maker(ptr_self, length)
 
-            # Handle aligned data types
-            if aligned:
+        # Getter method for aligned data types
+        elif aligned:
+            def fget(ptr_self):
                 return self[converter_name](ptr_self + offset)
 
-            # Handle unaligned data types
-            result = getattr(ptr_self, 'get_' + str_type)(offset)
-            if str_type == 'ptr':
-                return self[converter_name](result)
+        # Getter method for unaligned pointers, which run their result
+        # through the converter
+        elif str_type == 'ptr':
+            def fget(ptr_self):
+                return self[converter_name](getter(ptr_self, offset))
 
-            return result
+        # Getter method for all remaining unaligned data types
+        else:
+            def fget(ptr_self):
+                return getter(ptr_self, offset)
 
-        # Setter method
-        def fset(ptr_self, value):
-            # Handle arrays
-            if is_array:
+        # Setter method for arrays
+        if is_array:
+            def fset(ptr_self, value):
                 if isinstance(value, Pointer):
                     if length == -1:
                         if value.length == -1:
@@ -428,20 +475,22 @@ class TypeManager(dict):
                 for index, val in enumerate(value):
                     array[index] = val
 
-                return
-
-            # Handle aligned data types
-            if aligned:
+        # Setter method for aligned data types
+        elif aligned:
+            def fset(ptr_self, value):
                 Pointer(value).copy(
                     ptr_self + offset, self[converter_name].size * length
                 )
-                return
 
-            # Handle unaligned data types
-            if str_type == 'string_array':
+        # Setter method for string arrays, which require the length
+        elif str_type == 'string_array':
+            def fset(ptr_self, value):
                 ptr_self.set_string_array(value, offset, length)
-            else:
-                getattr(ptr_self, 'set_' + str_type)(value, offset)
+
+        # Setter method for all remaining unaligned data types
+        else:
+            def fset(ptr_self, value):
+                setter(ptr_self, value, offset)
 
         # Return the proper property object depending on the flags
         if flags & AttrFlags.READ_WRITE:
@@ -493,17 +542,55 @@ type_manager = TypeManager()
 # =============================================================================
 # >> FUNCTIONS
 # =============================================================================
+# Default converter for make_function() -- a module level object, so all
+# calls relying on the default share a single cache entry
+_default_converter = lambda x: x
+
+# Cache of Function objects created by make_function()
+_func_cache = {}
+
+# Cache of already unhexlified signatures, keyed by their identifier string
+_sig_cache = {}
+
+# Cache of loaded binaries, keyed by (path, srv_check)
+_binary_cache = {}
+
 def make_function(binary, identifier, convention, parameters,
-        converter=lambda x: x, srv_check=True, doc=None):
+        converter=_default_converter, srv_check=True, doc=None,
+        precomputed_sig=None):
     '''
     Creates a new function. Signatures have to be passed with spaces.
+
+    Results are cached, so requesting the same function again is a cheap
+    dictionary lookup instead of a full symbol/signature resolution.
+
+    If the signature bytes were already decoded elsewhere, they can be
+    passed via <precomputed_sig> to skip the unhexlify step.
     '''
 
-    binary = find_binary(binary, srv_check)
+    key = (binary, identifier, convention, parameters, converter, srv_check)
+    try:
+        return _func_cache[key]
+    except KeyError:
+        pass
+
+    binary_key = (binary, srv_check)
+    try:
+        binary = _binary_cache[binary_key]
+    except KeyError:
+        binary = _binary_cache[binary_key] = find_binary(binary, srv_check)
 
     # Is it a signature?
     if os.name == 'nt' and ' ' in identifier:
-        sig = binascii.unhexlify(identifier.replace(' ', ''))
+        if precomputed_sig is not None:
+            sig = precomputed_sig
+        else:
+            try:
+                sig = _sig_cache[identifier]
+            except KeyError:
+                sig = _sig_cache[identifier] = binascii.unhexlify(
+                    identifier.replace(' ', ''))
+
         func_ptr = binary.find_signature(sig)
 
         # Raise an error here. Maybe the user wanted to use a symbol, but
@@ -520,8 +607,26 @@ def make_function(binary, identifier, convention, parameters,
 
     func = func_ptr.make_function(convention, parameters, converter)
     func.__doc__ = doc
+    _func_cache[key] = func
     return func
 
+def clear_config_cache():
+    '''
+    Clears the cache of parsed data files. Call this if you have edited a
+    data file at runtime.
+    '''
+
+    helpers.clear_config_cache()
+
+def clear_binary_cache():
+    '''
+    Clears the caches of loaded binaries and resolved functions. Call this
+    if a library was unloaded at runtime.
+    '''
+
+    _binary_cache.clear()
+    _func_cache.clear()
+
 def create_string(text, size=None):
     '''
     Creates a new string. If <size> is None len(<text>) + 1 bytes are allocated.
@@ -3,13 +3,50 @@
 # =============================================================================
 # Python
 import os
-
-from configobj import ConfigObj
+import re
+import copy
+import mmap
 
 # binutils
 from _binutils import *
 
 
+# =============================================================================
+# >> CONSTANTS
+# =============================================================================
+# Matches section headers like "[name]" or nested ones like "[[name]]". The
+# number of opening brackets defines the nesting level.
+_SECTION_RE = re.compile(r'^\s*(\[+)\s*([^\[\]]+?)\s*\]+\s*$', re.M)
+
+# Matches "key = value" lines. Comment lines (";" or "#") are skipped.
+_KV_RE = re.compile(r'^\s*([^=;#\[\s][^=]*?)\s*=\s*(.*?)\s*$', re.M)
+
+# Cache of parsed data files, keyed by (absolute path, mtime, size)
+_parse_cache = {}
+
+# All attribute names of the Function class
+_FUNCTION_ATTRS = frozenset(dir(Function))
+
+# Suffix of OS specific keys in data files
+_OS_SUFFIX = '_' + os.name
+
+# Derived (OS specific key, shared key, converter, default) tuples, keyed by
+# the original key specification. The specifications are constants, so the
+# derived tuples only have to be built once per call site.
+_lookup_cache = {}
+
+# All accepted spellings of boolean values. The common capitalizations are
+# listed explicitly, so as_bool() rarely needs the lower() allocation.
+_BOOL_MAP = {
+    'true':  True,
+    'True':  True,
+    'TRUE':  True,
+    'false': False,
+    'False': False,
+    'FALSE': False
+}
+
+
 # =============================================================================
 # >> CLASSES
 # =============================================================================
@@ -18,18 +55,34 @@ class _EvalFunction(Function):
     Emulates a bound method.
     '''
 
+    __slots__ = ('is_virtual',)
+
     def __init__(self, func):
         super(_EvalFunction, self).__init__(func)
         self.is_virtual = False
 
     def __get__(self, this, cls):
         '''
-        Returns <self> if <this> is None. Otherwise it returns a new Thiscall
-        object.
+        Returns <self> if <this> is None. Otherwise it returns a Thiscall
+        object, which is cached on the instance, so it dies together with
+        its this-pointer.
         '''
 
-        func = self if this is None else Thiscall(self, this, False)
+        if this is None:
+            return self
+
+        cache = _get_thiscall_cache(this)
+        if cache is not None:
+            try:
+                return cache[self]
+            except KeyError:
+                pass
+
+        func = Thiscall(self, this, False)
         func.__doc__ = self.__doc__
+        if cache is not None:
+            cache[self] = func
+
         return func
 
 
@@ -39,6 +92,11 @@ class _EvalVirtualFunction(object):
     valid this-pointer was passed.
     '''
 
+    # "__dict__" stays available for the per-instance "__doc__" assignment,
+    # but the frequently accessed attributes get fast slot descriptors
+    __slots__ = ('index', 'convention', 'parameters', 'converter',
+        'is_virtual', '__dict__')
+
     def __init__(self, index, convention, parameters, converter):
         self.index      = index
         self.convention = convention
@@ -64,9 +122,18 @@ class _EvalVirtualFunction(object):
 
     def __eval_func(self, this):
         '''
-        Evaluates the function's address by using the given this-pointer.
+        Evaluates the function's address by using the given this-pointer. The
+        resulting Thiscall object is cached on the instance, so the virtual
+        table only has to be dereferenced once per pointer object.
         '''
 
+        cache = _get_thiscall_cache(this)
+        if cache is not None:
+            try:
+                return cache[self]
+            except KeyError:
+                pass
+
         this = Pointer(this)
         func = Thiscall(
             this.make_virtual_function(
@@ -80,6 +147,9 @@ class _EvalVirtualFunction(object):
         )
 
         func.__doc__ = self.__doc__
+        if cache is not None:
+            cache[self] = func
+
         return func
 
     def __getattr__(self, attr):
@@ -88,7 +158,12 @@ class _EvalVirtualFunction(object):
         an attribute or function of the Function class.
         '''
 
-        if attr in dir(Function):
+        # Short-circuit the dunders Python probes speculatively (pickling,
+        # copying, ...) before the membership test
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+
+        if attr in _FUNCTION_ATTRS:
             raise AttributeError('This function is virtual. You need a poin' \
                 'ter to access this attribute.')
 
@@ -96,6 +171,40 @@ class _EvalVirtualFunction(object):
             self.__class__.__name__, attr))
 
 
+class _LazyMember(object):
+    '''
+    Placeholder descriptor for members declared in a data file. The real
+    descriptor is built on first access and replaces this placeholder on the
+    class, so all subsequent accesses go through the normal attribute lookup
+    without any extra overhead.
+    '''
+
+    def __init__(self, manager, kind, data, name):
+        self.manager = manager
+        self.kind    = kind
+        self.data    = data
+        self.name    = name
+
+    def __get__(self, this, cls):
+        return self._materialize(cls).__get__(this, cls)
+
+    def __set__(self, this, value):
+        self._materialize(this.__class__)
+
+        # Re-run the attribute lookup, which now finds the real descriptor
+        setattr(this, self.name, value)
+
+    def _materialize(self, cls):
+        '''
+        Builds the real descriptor by calling the proper TypeManager method
+        and installs it on the class.
+        '''
+
+        descriptor = getattr(self.manager, self.kind)(*self.data)
+        setattr(cls, self.name, descriptor)
+        return descriptor
+
+
 class Thiscall(Function):
     '''
     This class is used to emulate functions which require a this-pointer. By
@@ -103,6 +212,8 @@ class Thiscall(Function):
     function. This is done behind the scene.
     '''
 
+    __slots__ = ('this', 'is_virtual')
+
     def __init__(self, func, this, is_virtual):
         '''
         Initializes the function and saves the this-pointer.
@@ -140,21 +251,110 @@ def read_files(*files):
 
     data = {}
     for f in files:
-        data.update(ConfigObj(f))
         try:
-            f.close()
+            buf = f.read()
         except AttributeError:
-            pass
+            # It's a path -- try the cache first. The modification time and
+            # size invalidate the entry when the file has changed.
+            path = os.path.abspath(f)
+            stats = os.stat(path)
+            key = (path, stats.st_mtime, stats.st_size)
+            try:
+                parsed = _parse_cache[key]
+            except KeyError:
+                # Map the file into memory and let the regexes scan the
+                # mapping directly instead of copying the file into a string
+                # first. Empty files cannot be mapped.
+                with open(path, 'rb') as fp:
+                    if stats.st_size:
+                        buf = mmap.mmap(
+                            fp.fileno(), 0, access=mmap.ACCESS_READ)
+                        try:
+                            parsed = parse_config(buf)
+                        finally:
+                            buf.close()
+                    else:
+                        parsed = {}
+
+                _parse_cache[key] = parsed
+
+            # Hand out a copy, so callers cannot corrupt the cache
+            data.update(copy.deepcopy(parsed))
+            continue
+
+        # File-like objects lack a stable identity, so they bypass the cache
+        try:
+            data.update(parse_config(buf))
+        finally:
+            f.close()
 
     return data
 
+def clear_config_cache():
+    '''
+    Clears the cache of parsed data files. Call this if you have edited a
+    data file at runtime and want read_files() to pick up the change even
+    though the file's modification time did not change.
+    '''
+
+    _parse_cache.clear()
+
+def parse_config(buf):
+    '''
+    Parses a config string of the layout documented in
+    TypeManager.create_pipe_from_file() and
+    TypeManager.create_type_from_file() into a dictionary.
+
+    The whole buffer is processed in a single pass by two compiled regexes,
+    which is a lot faster than a per-line parser. Sections nest by the number
+    of brackets in their header ("[[name]]" is a sub-section of the last
+    "[name]").
+    '''
+
+    data = {}
+
+    # Stack of the section dictionaries we are currently nested in. The first
+    # entry is the top level dictionary.
+    stack = [data]
+
+    def add_values(start, end):
+        section = stack[-1]
+        for match in _KV_RE.finditer(buf, start, end):
+            key, value = match.groups()
+
+            # Strip matching surrounding quotes
+            if len(value) > 1 and value[0] == value[-1] and value[0] in '\'"':
+                value = value[1:-1]
+
+            section[key] = value
+
+    pos = 0
+    for match in _SECTION_RE.finditer(buf):
+        # Everything between the last header and this one belongs to the
+        # current section
+        add_values(pos, match.start())
+        pos = match.end()
+
+        # The number of opening brackets defines the nesting level
+        level = len(match.group(1))
+        if level > len(stack):
+            raise ValueError('Sub-section "%s" has no parent section.'% \
+                match.group(2))
+
+        del stack[level:]
+        section = stack[-1][match.group(2)] = {}
+        stack.append(section)
+
+    add_values(pos, len(buf))
+    return data
+
 def parse_data(raw_data, keys):
     '''
     Parses the data dictionary by converting the values of the given keys into
     the proper type or assigning them default values. Raises a KeyError if a
     key does not exist and if no default value is available.
 
-    Returns a generator: (<name>, [<value of key0>, <value of key1>, ...])
+    Returns a list: [(<name>, [<value of key0>, <value of key1>, ...]), ...]
 
     <keys> must have the following structure:
     ((<key name>, <converter>, <default value or None>), ...)
@@ -182,12 +382,29 @@ def parse_data(raw_data, keys):
     identifier_posix = <symbol for Linux>
     '''
 
+    # Build the OS specific key names once per specification instead of per
+    # call. Unhashable specifications are derived on the fly.
+    try:
+        lookups = _lookup_cache[keys]
+    except KeyError:
+        lookups = _lookup_cache[keys] = tuple(
+            (key + _OS_SUFFIX, key, converter, default)
+            for key, converter, default in keys)
+    except TypeError:
+        lookups = tuple(
+            (key + _OS_SUFFIX, key, converter, default)
+            for key, converter, default in keys)
+
+    result = []
     for func_name, func_data in raw_data.iteritems():
         data = []
-        for key, converter, default in keys:
+        for os_key, key, converter, default in lookups:
             # Get the OS specific key. If that fails, fall back to the shared
             # key. If that fails too, use the default value
-            value = func_data.get(key + '_' + os.name, func_data.get(key, default))
+            try:
+                value = func_data[os_key]
+            except KeyError:
+                value = func_data.get(key, default)
 
             # If this is still None, we are missing that information
             if value is None:
@@ -195,7 +412,9 @@ def parse_data(raw_data, keys):
 
             data.append(converter(value))
 
-        yield (func_name, data)
+        result.append((func_name, data))
+
+    return result
 
 def as_bool(value):
     '''
@@ -203,11 +422,35 @@ def as_bool(value):
     Raises a ValueError if the string doesn't represent such a value.
     '''
 
-    value = value.lower()
-    if value == 'true':
-        return True
+    try:
+        return _BOOL_MAP[value]
+    except KeyError:
+        pass
+
+    try:
+        return _BOOL_MAP[value.lower()]
+    except KeyError:
+        raise ValueError('Cannot convert "%s" to a boolean value.'% value)
+
+def _get_thiscall_cache(this):
+    '''
+    Returns the Thiscall cache of the given this-pointer, creating it on
+    first use. The cache lives on the pointer object and is keyed by
+    descriptor, so its entries are released together with the pointer and a
+    recycled address can never receive a stale Thiscall.
+
+    Returns None for objects that cannot carry attributes (e.g. raw integer
+    addresses), which are simply not cached.
+    '''
+
+    try:
+        return this._thiscall_cache
+    except AttributeError:
+        pass
 
-    if value == 'false':
-        return False
+    try:
+        cache = this._thiscall_cache = {}
+    except AttributeError:
+        return None
 
-    raise ValueError('Cannot convert "%s" to a boolean value.'% value)
\ No newline at end of file
+    return cache
\ No newline at end of file